@@ -37,6 +37,13 @@ class ChainMixin(abc.ABC):
     Implements the chain of responsibility pattern for processing operations.
     """
 
+    __slots__ = ()
+
+    # class level defaults, so handlers don't need an initializer to be chained; a slotted handler must
+    # declare "_next" and "_tail" itself, and as an unset slot hides these defaults they're read with getattr
+    _next: "ChainMixin | None" = None
+    _tail: "ChainMixin | None" = None
+
     def next(self, handler: "ChainMixin") -> "ChainMixin":
         """Add the next handler in the chain.
 
@@ -50,12 +57,37 @@ class ChainMixin(abc.ABC):
         ChainMixin
             The current chain instance for method chaining.
         """
-        if "_next" not in self.__dict__ or self._next is None:
-            self._next: "ChainMixin" = handler  # noqa: UP037
-        else:
-            self._next.next(handler)
+        # keep a tail reference on the head so appending doesn't walk the whole chain; the tail is only
+        # advanced lazily, which also covers handlers that came with their own chain or were extended directly
+        tail = getattr(self, "_tail", None)
+        if tail is None:
+            tail = self
+        while (following := getattr(tail, "_next", None)) is not None:
+            tail = following
+        tail._next = handler  # noqa: SLF001
+        self._tail = handler
         return self
 
+    def run_chain(self, initial: dict[str, Any] | None = None) -> dict[str, Any]:
+        """Execute the chain from this handler with a single context shared by all handlers.
+
+        The context is allocated once, here, and the very same dict is passed along the chain,
+        so handlers must update it in place rather than replace it.
+
+        Parameters
+        ----------
+        initial : dict[str, Any] | None
+            Initial context, a new empty one is used if not provided.
+
+        Returns
+        -------
+        dict[str, Any]
+            The context, as left by the handlers.
+        """
+        context = {} if initial is None else initial
+        self.execute(context=context)
+        return context
+
     @abc.abstractmethod
     def execute(self, context: dict[str, Any] | None = None) -> Any:
         """Execute the operation in the chain.
@@ -79,6 +111,8 @@ class ProcessorChainMixin(ChainMixin):
     Executes processor logic and passes control to the next handler in the chain.
     """
 
+    __slots__ = ()
+
     def execute(self, context: dict[str, Any] | None = None) -> Any:
         """Execute processor and continue to next handler.
 
@@ -92,9 +126,14 @@ class ProcessorChainMixin(ChainMixin):
         Any
             Result from processing.
         """
-        self.process(context=context)
-        if "_next" in self.__dict__ and self._next is not None:
-            self._next.execute(context=context)
+        # walk the chain iteratively rather than recursing, while handlers share this very execute;
+        # any other kind of handler is handed over to its own execute
+        handler: ChainMixin | None = self
+        while handler is not None and type(handler).execute is ProcessorChainMixin.execute:
+            handler.process(context=context)
+            handler = getattr(handler, "_next", None)
+        if handler is not None:
+            handler.execute(context=context)
 
 
 @ChainInterface.register
@@ -104,6 +143,8 @@ class ProcessorChain(ProcessorChainMixin, Processor):
     Combines ProcessorChainMixin and Processor for chainable processing.
     """
 
+    __slots__ = ()
+
 
 @ChainInterface.register
 class Chain(ChainMixin, abc.ABC):
@@ -112,6 +153,8 @@ class Chain(ChainMixin, abc.ABC):
     Extends ChainMixin to provide a base for custom chainable components.
     """
 
+    __slots__ = ()
+
     @abc.abstractmethod
     def execute(self, context: dict[str, Any] | None = None) -> Any:
         """Execute the chain operation.
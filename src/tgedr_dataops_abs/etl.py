@@ -23,13 +23,20 @@ class MyEtl(Etl):
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import inspect
 import logging
+import queue
+import threading
 from typing import Any
 
 
 logger = logging.getLogger(__name__)
 
+# marks the end of the batches flowing between the stages of `Etl.run_pipelined`
+_END_OF_BATCHES = object()
+
 
 class EtlException(Exception):
     """Exception raised for ETL-related errors."""
@@ -42,6 +49,9 @@ class Etl(ABC):
     injection and optional validation hooks.
     """
 
+    # no slots of its own, so it can be combined with other bases; slotted implementations declare "_configuration"
+    __slots__ = ()
+
     def __init__(self, configuration: dict[str, Any] | None = None) -> None:
         """Initialize a new instance of ETL.
 
@@ -115,31 +125,188 @@ class Etl(ABC):
         logger.info("[run|out] => %s", result)
         return result
 
+    @classmethod
+    def run_many(cls, configurations: list[dict[str, Any]], max_workers: int | None = None) -> list[Any]:
+        """Execute the complete ETL workflow once per configuration, in parallel worker processes.
+
+        Each configuration is run by a new instance created in a worker process, so the class
+        must be importable, configurations and results must be picklable, and changes the
+        workflow makes to its configuration stay in the worker.
+
+        Parameters
+        ----------
+        configurations : list[dict[str, Any]]
+            The configurations to run the ETL with, one run each.
+        max_workers : int | None
+            Maximum number of worker processes, defaults to the number of processors.
+
+        Returns
+        -------
+        list[Any]
+            Results from the load operation of each run, in the same order as `configurations`.
+        """
+        logger.info("[run_many|in] (%s, %s)", configurations, max_workers)
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            result = list(executor.map(_run_one, [(cls, configuration) for configuration in configurations]))
+
+        logger.info("[run_many|out] => %s", result)
+        return result
+
+    def extract_iter(self) -> Iterator[Any]:
+        """Extract data from source as a sequence of batches, used by `run_pipelined`.
+
+        Returns
+        -------
+        Iterator[Any]
+            Extracted batches.
+        """
+        raise NotImplementedError
+
+    def transform_batch(self, batch: Any) -> Any:
+        """Transform one extracted batch, used by `run_pipelined`.
+
+        Parameters
+        ----------
+        batch : Any
+            Extracted batch.
+
+        Returns
+        -------
+        Any
+            Transformed batch.
+        """
+        raise NotImplementedError
+
+    def load_batch(self, batch: Any) -> Any:
+        """Load one transformed batch to destination, used by `run_pipelined`.
+
+        Parameters
+        ----------
+        batch : Any
+            Transformed batch.
+
+        Returns
+        -------
+        Any
+            Result of load operation.
+        """
+        raise NotImplementedError
+
+    def run_pipelined(self, prefetch: int = 2) -> list[Any]:
+        """Execute the ETL workflow batch by batch, overlapping its stages.
+
+        Runs extract_iter, transform_batch and load_batch in their own threads, connected by
+        queues holding up to `prefetch` batches, so that a batch can be extracted while the
+        previous ones are being transformed and loaded. If a stage fails the stages before it
+        stop, the batches already handed to the stages after it are still processed, and the
+        error is raised. The `validate_extract` and `validate_transform` hooks are not
+        called, so batch implementations must do their own checks.
+
+        Parameters
+        ----------
+        prefetch : int
+            Maximum number of batches waiting between two stages, at least 1.
+
+        Returns
+        -------
+        list[Any]
+            Results from the load operation of each batch, in extraction order.
+
+        Raises
+        ------
+        EtlException
+            If `prefetch` is lower than 1.
+        """
+        logger.info("[run_pipelined|in] (%s)", prefetch)
+
+        if prefetch < 1:
+            msg = f"prefetch must be at least 1, got {prefetch}"
+            raise EtlException(msg)
+
+        extracted: queue.Queue = queue.Queue(maxsize=prefetch)
+        transformed: queue.Queue = queue.Queue(maxsize=prefetch)
+        # set when transform or load fail, so that the stages before them stop
+        failed = threading.Event()
+        result: list[Any] = []
+
+        def drain(batches: queue.Queue) -> None:
+            # keeps upstream stages from blocking on a full queue once a downstream stage fails
+            while batches.get() is not _END_OF_BATCHES:
+                pass
+
+        def extract() -> None:
+            try:
+                for batch in self.extract_iter():
+                    if failed.is_set():
+                        break
+                    extracted.put(batch)
+            finally:
+                extracted.put(_END_OF_BATCHES)
+
+        def transform() -> None:
+            try:
+                while (batch := extracted.get()) is not _END_OF_BATCHES:
+                    if failed.is_set():
+                        drain(extracted)
+                        break
+                    transformed.put(self.transform_batch(batch))
+            except Exception:
+                failed.set()
+                drain(extracted)
+                raise
+            finally:
+                transformed.put(_END_OF_BATCHES)
+
+        def load() -> None:
+            try:
+                while (batch := transformed.get()) is not _END_OF_BATCHES:
+                    result.append(self.load_batch(batch))
+            except Exception:
+                failed.set()
+                drain(transformed)
+                raise
+
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            stages = [executor.submit(stage) for stage in (extract, transform, load)]
+        for stage in stages:
+            stage.result()
+
+        logger.info("[run_pipelined|out] => %s", result)
+        return result
+
     @staticmethod
     def inject_configuration(f):  # noqa: ANN001, ANN205, D102
+        # the signature is fixed at decoration time, so resolve it once here and keep the per-call path to dict lookups
+        signature = inspect.signature(f)
+        params_order = [parameter for parameter in signature.parameters if parameter != "self"]
+        defaults = {
+            param: signature.parameters[param].default
+            for param in params_order
+            if signature.parameters[param].default is not inspect.Parameter.empty
+        }
+        required = [param for param in params_order if param not in defaults]
+        required_keys = frozenset(required)
+        # (name, default) pairs so that each argument is resolved with a single configuration lookup
+        bindings = tuple((param, defaults.get(param)) for param in params_order)
+
         def decorator(self):  # noqa: ANN001, ANN202
-            signature = inspect.signature(f)
-
-            missing_params = []
-            params = {}
-            for param in [parameter for parameter in signature.parameters if parameter != "self"]:
-                if signature.parameters[param].default != inspect._empty:  # noqa: SLF001
-                    params[param] = signature.parameters[param].default
-                else:
-                    params[param] = None
-                    if self._configuration is None or param not in self._configuration:
-                        missing_params.append(param)
-
-                if self._configuration is not None and param in self._configuration:
-                    params[param] = self._configuration[param]
-
-            if 0 < len(missing_params):
+            configuration = self._configuration or {}
+
+            if not configuration.keys() >= required_keys:
+                missing_params = [param for param in required if param not in configuration]
                 msg = f"missing required configuration parameters: {missing_params}"
                 raise EtlException(msg)
 
             return f(
                 self,
-                *[params[argument] for argument in params],
+                *[configuration.get(param, default) for param, default in bindings],
             )
 
         return decorator
+
+
+def _run_one(args: tuple[type[Etl], dict[str, Any]]) -> Any:
+    """Run one configuration in a worker process, see `Etl.run_many`."""
+    cls, configuration = args
+    return cls(configuration).run()
@@ -6,17 +6,31 @@ This module provides:
 """
 
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+import functools
+import json
 import logging
+import threading
 from typing import Any
 
 import great_expectations as gx
 from great_expectations.expectations.expectation_configuration import ExpectationConfiguration
 from great_expectations.core.batch import Batch
+from great_expectations.data_context import AbstractDataContext
 from great_expectations.execution_engine import ExecutionEngine
 from great_expectations.validator.validator import Validator
 
 logger = logging.getLogger(__name__)
 
+# ephemeral data context shared by all validations of the process, see `_get_context`
+_CONTEXT: AbstractDataContext | None = None
+_CONTEXT_LOCK = threading.Lock()
+# maximum number of expectation suites kept by each instance, see `_get_expectation_suite`
+_SUITE_CACHE_SIZE = 32
+# maximum number of validation instances kept by each worker process, see `_get_worker_validation`
+_WORKER_CACHE_SIZE = 8
+
 
 class ValidationError(Exception):
     """Exception raised for validation errors in data validation operations."""
@@ -33,6 +47,8 @@ class GreatExpectationsValidation(ABC):
     -------
     validate(df: Any, expectations: dict) -> dict
         Validate a dataframe against Great Expectations suite.
+    validate_many(dfs: list, expectations: dict, max_workers: int | None) -> list[dict]
+        Validate several dataframes against the same suite in parallel worker processes.
     _get_execution_engine(batch_data_dict: dict) -> ExecutionEngine
         Get the execution engine used by the validation implementation (abstract).
     """
@@ -74,22 +90,12 @@ class GreatExpectationsValidation(ABC):
             # Get batch from dataframe
             batch = Batch(data=df)
 
-            # Create expectation suite from dict
-            suite_name = expectations.get("expectation_suite_name", "validation_suite")
-            suite = gx.ExpectationSuite(name=suite_name)
-
-            # Add expectations from dict
-            for exp_config in expectations.get("expectations", []):
-                exp_type = exp_config.get("expectation_type")
-                exp_kwargs = exp_config.get("kwargs", {})
-
-                # Create ExpectationConfiguration with 'type' parameter (not 'expectation_type')
-                expectation = ExpectationConfiguration(type=exp_type, kwargs=exp_kwargs)
-                suite.add_expectation_configuration(expectation)
+            # Get expectation suite from dict, built once per distinct expectations
+            suite = self._get_expectation_suite(expectations)
 
             # Create validator directly from batch and suite
             # This avoids the FluentBatch requirement in context.get_validator for GE 1.9.1
-            context = gx.get_context(mode="ephemeral")
+            context = _get_context()
             execution_engine = self._get_execution_engine(batch_data_dict={batch.id: batch.data})
             validator = Validator(
                 execution_engine=execution_engine, batches=[batch], expectation_suite=suite, data_context=context
@@ -107,6 +113,90 @@ class GreatExpectationsValidation(ABC):
         logger.info("[validate|out] => %s", result.get("success"))
         return result
 
+    def validate_many(self, dfs: list, expectations: dict, max_workers: int | None = None) -> list[dict]:
+        """Validate several dataframes against the same Great Expectations suite in parallel.
+
+        Each dataframe is validated in a worker process, using an instance of this implementation
+        created there with no arguments, so the implementation class must be importable and
+        instantiable without arguments, and dataframes and results must be picklable.
+
+        Parameters
+        ----------
+        dfs : list
+            The dataframes to validate.
+        expectations : dict
+            Dictionary containing expectation configurations, as in `validate`.
+        max_workers : int | None
+            Maximum number of worker processes, defaults to the number of processors.
+
+        Returns
+        -------
+        list[dict]
+            Validation results, in the same order as `dfs`.
+
+        Raises
+        ------
+        ValidationError
+            If the validation of any of the dataframes fails or encounters an error.
+        """
+        logger.info("[validate_many|in] (%d dataframes, %s, %s)", len(dfs), expectations, max_workers)
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            result = list(executor.map(_validate_one, [(type(self), df, expectations) for df in dfs]))
+
+        logger.info("[validate_many|out] => %s", [r.get("success") for r in result])
+        return result
+
+    def _get_expectation_suite(self, expectations: dict) -> gx.ExpectationSuite:
+        """Get the expectation suite for the expectations dict, building it only on first use.
+
+        Suites are cached by the JSON form of the expectations, so repeated validations against the
+        same expectations skip suite construction, while a mutated dict still gets a fresh suite.
+        Only the `_SUITE_CACHE_SIZE` most recently used suites are kept. Expectations that are not
+        JSON serializable are built on every call.
+
+        Parameters
+        ----------
+        expectations : dict
+            Dictionary containing expectation configurations, as in `validate`.
+
+        Returns
+        -------
+        gx.ExpectationSuite
+            The expectation suite.
+        """
+        if "_suite_cache" not in self.__dict__:
+            self._suite_cache: OrderedDict[str, gx.ExpectationSuite] = OrderedDict()
+
+        try:
+            key = json.dumps(expectations, sort_keys=True)
+        except TypeError:
+            key = None
+
+        suite = self._suite_cache.get(key) if key is not None else None
+        if suite is not None:
+            self._suite_cache.move_to_end(key)
+        else:
+            # Create expectations from dict, with ExpectationConfiguration 'type' parameter (not 'expectation_type'),
+            # converted upfront as the suite constructor would skip invalid ones instead of raising
+            suite_expectations = [
+                ExpectationConfiguration(
+                    type=exp_config.get("expectation_type"), kwargs=exp_config.get("kwargs", {})
+                ).to_domain_obj()
+                for exp_config in expectations.get("expectations", [])
+            ]
+
+            # Create expectation suite with all its expectations at once
+            suite_name = expectations.get("expectation_suite_name", "validation_suite")
+            suite = gx.ExpectationSuite(name=suite_name, expectations=suite_expectations)
+
+            if key is not None:
+                self._suite_cache[key] = suite
+                if len(self._suite_cache) > _SUITE_CACHE_SIZE:
+                    self._suite_cache.popitem(last=False)
+
+        return suite
+
     @abstractmethod
     def _get_execution_engine(self, batch_data_dict: dict) -> ExecutionEngine:
         """Get the execution engine used by the validation implementation.
@@ -117,3 +207,25 @@ class GreatExpectationsValidation(ABC):
             The execution engine instance.
         """
         raise NotImplementedError
+
+
+def _get_context() -> AbstractDataContext:
+    """Get the ephemeral data context of the process, creating it only on first use."""
+    global _CONTEXT  # noqa: PLW0603
+    if _CONTEXT is None:
+        with _CONTEXT_LOCK:
+            if _CONTEXT is None:
+                _CONTEXT = gx.get_context(mode="ephemeral")
+    return _CONTEXT
+
+
+@functools.lru_cache(maxsize=_WORKER_CACHE_SIZE)
+def _get_worker_validation(cls: type[GreatExpectationsValidation]) -> GreatExpectationsValidation:
+    """Get the validation instance of a worker process, kept so that its caches are reused across validations."""
+    return cls()
+
+
+def _validate_one(args: tuple[type[GreatExpectationsValidation], Any, dict]) -> dict:
+    """Validate one dataframe in a worker process, see `GreatExpectationsValidation.validate_many`."""
+    cls, df, expectations = args
+    return _get_worker_validation(cls).validate(df, expectations)
@@ -2,9 +2,24 @@
 
 Provides abstract base classes and interfaces for implementing processors that
 transform data based on context.
+
+Example:
+-------
+```python
+class MyProcessor(Processor):
+    @staticmethod
+    @Processor.jit
+    def _scale(values, factor):
+        # numeric kernel compiled by numba, runs without holding the GIL
+        return values * factor
+
+    def process(self, context=None) -> None:
+        context["values"] = self._scale(context["values"], 2.0)
+```
 """
 
 import abc
+from collections.abc import Callable
 from typing import Any
 
 
@@ -28,6 +43,9 @@ class ProcessorInterface(metaclass=abc.ABCMeta):
 class Processor(abc.ABC):
     """Abstract base class for processors that transform data."""
 
+    # no slots of its own, so it can be combined with the other bases; slotted implementations declare "_config"
+    __slots__ = ()
+
     def __init__(self, config: dict[str, Any] | None = None) -> None:
         """Initialize processor with optional configuration.
 
@@ -53,3 +71,44 @@ class Processor(abc.ABC):
             Processed result.
         """
         raise NotImplementedError
+
+    @staticmethod
+    def jit(f: Callable | None = None, *, signatures: list[str] | None = None) -> Callable:
+        """Compile a numeric kernel with numba, to be used by `process` implementations.
+
+        The kernel is compiled in nopython mode on its first call, releasing the GIL while it runs,
+        and the compiled code is cached on disk so later processes skip compilation. When
+        `signatures` are given the kernel is compiled for them eagerly, when it is decorated,
+        so importing the module once ahead of time (e.g. when building a job image) leaves
+        single-shot runs with nothing to compile. Only numeric code supported by numba can be
+        compiled, so decorate the kernel called by `process` rather than `process` itself.
+        Requires the optional `numba` dependency.
+
+        Parameters
+        ----------
+        f : Callable | None
+            The numeric kernel to compile, omitted when the decorator is used with arguments.
+        signatures : list[str] | None
+            Numba signatures to compile the kernel for eagerly, e.g. `["float64[:](float64[:], float64)"]`.
+
+        Returns
+        -------
+        Callable
+            The compiled kernel, or a decorator compiling it when `f` is omitted.
+
+        Raises
+        ------
+        ProcessorException
+            If numba is not installed.
+        """
+        try:
+            import numba
+        except ImportError as x:
+            msg = "numba is required to compile processor kernels, install 'tgedr-dataops-abs[numba]'"
+            raise ProcessorException(msg) from x
+
+        if signatures is None:
+            decorator = numba.njit(cache=True, nogil=True)
+        else:
+            decorator = numba.njit(signatures, cache=True, nogil=True)
+        return decorator if f is None else decorator(f)
@@ -35,6 +35,9 @@ class SinkInterface(metaclass=abc.ABCMeta):
 class Sink(abc.ABC):
     """Abstract class defining methods ('put' and 'delete') to manage persistence of data somewhere as defined by implementing classes."""
 
+    # no slots of its own, so it can be combined with the other bases; slotted implementations declare "_config"
+    __slots__ = ()
+
     def __init__(self, config: dict[str, Any] | None = None) -> None:
         """Initialize sink with optional configuration.
 
@@ -80,6 +83,8 @@ class SinkChain(Chain, abc.ABC):
     Combines Chain and Sink capabilities for building processing pipelines.
     """
 
+    __slots__ = ()
+
     def execute(self, context: dict[str, Any] | None = None) -> Any:
         """Execute the sink operation by calling put.
 
@@ -39,6 +39,9 @@ class SourceInterface(metaclass=abc.ABCMeta):
 class Source(abc.ABC):
     """Abstract class defining methods ('list' and 'get') to manage retrieval of data from somewhere as defined by implementing classes."""
 
+    # no slots of its own, so it can be combined with the other bases; slotted implementations declare "_config"
+    __slots__ = ()
+
     def __init__(self, config: dict[str, Any] | None = None) -> None:
         """Initialize source with optional configuration.
 
@@ -89,6 +92,8 @@ class SourceChain(Chain, abc.ABC):
     Combines Chain and Source capabilities for building processing pipelines.
     """
 
+    __slots__ = ()
+
     def execute(self, context: dict[str, Any] | None = None) -> Any:
         """Execute the source operation by calling get.
 
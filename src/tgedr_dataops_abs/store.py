@@ -41,6 +41,9 @@ class StoreInterface(metaclass=abc.ABCMeta):
 class Store(abc.ABC):
     """Abstract class used to manage persistence, defining CRUD-like (CreateReadUpdateDelete) methods."""
 
+    # no slots of its own, so it can be combined with the other bases; slotted implementations declare "_config"
+    __slots__ = ()
+
     def __init__(self, config: dict[str, Any] | None = None) -> None:
         """Initialize store with optional configuration.
 
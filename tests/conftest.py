@@ -3,11 +3,18 @@
 from pathlib import Path
 import sys
 import tempfile
+from types import MappingProxyType
 import pytest
 
 
 sys.path.insert(0, Path(__file__).parent.parent.joinpath("src").absolute())  # isort:skip
 
+# load the lightweight package modules once per process, before any test module (or xdist worker) is collected
+import tgedr_dataops_abs.chain  # noqa: E402, F401  # isort:skip
+import tgedr_dataops_abs.sink  # noqa: E402, F401  # isort:skip
+import tgedr_dataops_abs.source  # noqa: E402, F401  # isort:skip
+import tgedr_dataops_abs.store  # noqa: E402, F401  # isort:skip
+
 
 @pytest.fixture(scope="session")
 def resources_folder() -> str:
@@ -34,3 +41,19 @@ def temporary_folder() -> str:
     if not _path.exists():
         _path.mkdir(parents=True)
     return _folder
+
+
+@pytest.fixture(scope="session")
+def sample_payloads() -> MappingProxyType:
+    """Provides read-only example data shared by the tests.
+
+    Returns:
+        mapping with a `small_list` tuple and a `ctx` context mapping
+
+    """
+    return MappingProxyType(
+        {
+            "small_list": (1, 2, 3, 4, 5),
+            "ctx": MappingProxyType({"key": "value", "data": (1, 2, 3)}),
+        }
+    )
@@ -0,0 +1,636 @@
+import inspect
+from typing import Any, Dict, Optional
+
+import pytest
+
+from tgedr_dataops_abs.chain import Chain, ProcessorChain
+from tgedr_dataops_abs.etl import Etl
+from tgedr_dataops_abs.processor import Processor
+from tgedr_dataops_abs.sink import Sink, SinkChain, SinkException, SinkInterface
+from tgedr_dataops_abs.source import (
+    NoSourceException,
+    Source,
+    SourceChain,
+    SourceException,
+    SourceInterface,
+)
+from tgedr_dataops_abs.store import NoStoreException, Store, StoreException, StoreInterface
+
+
+class NotAnything:
+    """Class that doesn't implement any of the interfaces."""
+
+    pass
+
+
+# ----- sink -----
+
+_SINK_CFG = {"bucket": "test-bucket", "prefix": "data/"}
+
+
+class ConcreteSink(Sink):
+    """Concrete implementation of Sink for testing."""
+
+    __slots__ = ("_config", "put_called", "delete_called", "last_context")
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        super().__init__(config)
+        self.put_called = False
+        self.delete_called = False
+        self.last_context = None
+
+    def put(self, context: Optional[Dict[str, Any]] = None) -> Any:
+        self.put_called = True
+        self.last_context = context
+        return {"status": "put_success", "context": context}
+
+    def delete(self, context: Optional[Dict[str, Any]] = None):
+        self.delete_called = True
+        self.last_context = context
+
+
+class ConcreteSinkChain(SinkChain):
+    """Concrete implementation of SinkChain for testing."""
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        self._config = config
+        self.put_called = False
+
+    def put(self, context: Optional[Dict[str, Any]] = None) -> Any:
+        self.put_called = True
+        return {"chain_result": "success"}
+
+    def delete(self, context: Optional[Dict[str, Any]] = None):
+        pass
+
+
+class PartialSink:
+    """Class that partially implements Sink interface (missing delete)."""
+
+    def put(self, context: Optional[Dict[str, Any]] = None) -> Any:
+        return "put"
+
+
+@pytest.fixture(scope="module")
+def readonly_sink():
+    """ConcreteSink shared by the tests that only read it."""
+    return ConcreteSink(_SINK_CFG)
+
+
+def test_sink_exception():
+    """Test SinkException is an exception carrying its message."""
+    assert issubclass(SinkException, Exception)
+    assert str(SinkException("test error")) == "test error"
+
+
+@pytest.mark.parametrize(
+    "cls,expected",
+    [
+        pytest.param(ConcreteSink, True, id="valid"),
+        pytest.param(NotAnything, False, id="invalid"),
+        pytest.param(PartialSink, False, id="partial"),
+    ],
+)
+def test_sink_interface_subclass_hook(cls, expected):
+    """Test that only complete Sink implementations are recognized by the interface."""
+    assert issubclass(cls, SinkInterface) is expected
+
+
+def test_sink_init_with_config(readonly_sink):
+    """Test Sink initialization with configuration."""
+    assert readonly_sink._config == _SINK_CFG
+
+
+def test_sink_init_without_config():
+    """Test Sink initialization without configuration."""
+    sink = ConcreteSink()
+    assert sink._config is None
+
+
+def test_sink_put_with_context(sample_payloads):
+    """Test Sink put method with context."""
+    sink = ConcreteSink(_SINK_CFG)
+    context = sample_payloads["ctx"]
+
+    result = sink.put(context)
+
+    assert sink.put_called
+    assert sink.last_context == context
+    assert result["status"] == "put_success"
+    assert result["context"] == context
+
+
+def test_sink_put_without_context():
+    """Test Sink put method without context."""
+    sink = ConcreteSink()
+
+    result = sink.put()
+
+    assert sink.put_called
+    assert sink.last_context is None
+    assert result["status"] == "put_success"
+    assert result["context"] is None
+
+
+def test_sink_delete_with_context():
+    """Test Sink delete method with context."""
+    sink = ConcreteSink()
+    context = {"key": "item-to-delete"}
+
+    sink.delete(context)
+
+    assert sink.delete_called
+    assert sink.last_context == context
+
+
+def test_sink_delete_without_context():
+    """Test Sink delete method without context."""
+    sink = ConcreteSink()
+
+    sink.delete()
+
+    assert sink.delete_called
+    assert sink.last_context is None
+
+
+def test_sink_abstract_methods():
+    """Test that Sink cannot be instantiated directly due to abstract methods."""
+    assert inspect.isabstract(Sink)
+    assert Sink.__abstractmethods__ == frozenset({"put", "delete"})
+
+
+@pytest.mark.parametrize(
+    "config,context",
+    [
+        pytest.param({"output": "destination"}, {"data": "test"}, id="with_config_and_context"),
+        pytest.param(None, None, id="without_config_and_context"),
+    ],
+)
+def test_sink_chain(config, context):
+    """Test SinkChain initialization, execution through put, and that it is both a Chain and a SinkInterface."""
+    chain = ConcreteSinkChain(config)
+    assert chain._config == config
+
+    result = chain.execute(context)
+
+    assert chain.put_called
+    assert result["chain_result"] == "success"
+    assert isinstance(chain, Chain)
+    assert issubclass(ConcreteSinkChain, SinkInterface)
+
+
+# ----- source -----
+
+_SOURCE_CFG = {"endpoint": "http://api.example.com", "api_key": "secret"}
+_CTX_GET = {"id": "123", "filter": "active"}
+
+
+class ConcreteSource(Source):
+    """Concrete implementation of Source for testing."""
+
+    __slots__ = ("_config", "get_called", "list_called", "last_context")
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        super().__init__(config)
+        self.get_called = False
+        self.list_called = False
+        self.last_context = None
+
+    def get(self, context: Optional[Dict[str, Any]] = None) -> Any:
+        self.get_called = True
+        self.last_context = context
+        return {"data": "retrieved", "context": context}
+
+    def list(self, context: Optional[Dict[str, Any]] = None) -> Any:
+        self.list_called = True
+        self.last_context = context
+        return ["item1", "item2", "item3"]
+
+
+class FailingSource(ConcreteSource):
+    """Source for testing that never finds what it is asked for."""
+
+    __slots__ = ()
+
+    def get(self, context: Optional[Dict[str, Any]] = None) -> Any:
+        self.get_called = True
+        self.last_context = context
+        raise NoSourceException("Source not found")
+
+
+class ConcreteSourceChain(SourceChain):
+    """Concrete implementation of SourceChain for testing."""
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        self._config = config
+        self.get_called = False
+
+    def get(self, context: Optional[Dict[str, Any]] = None) -> Any:
+        self.get_called = True
+        return {"chain_data": "success"}
+
+    def list(self, context: Optional[Dict[str, Any]] = None) -> Any:
+        return []
+
+
+class PartialSource:
+    """Class that partially implements Source interface (missing list)."""
+
+    def get(self, context: Optional[Dict[str, Any]] = None) -> Any:
+        return "data"
+
+
+@pytest.fixture(scope="module")
+def readonly_source():
+    """ConcreteSource shared by the tests that only read it."""
+    return ConcreteSource(_SOURCE_CFG)
+
+
+def test_source_exception():
+    """Test SourceException is an exception carrying its message."""
+    assert issubclass(SourceException, Exception)
+    assert str(SourceException("test error")) == "test error"
+
+
+def test_no_source_exception():
+    """Test NoSourceException is an exception carrying its message."""
+    assert issubclass(NoSourceException, Exception)
+    assert str(NoSourceException("source not found")) == "source not found"
+
+
+def test_no_source_exception_is_source_exception():
+    """Test NoSourceException is a subclass of SourceException."""
+    assert issubclass(NoSourceException, SourceException)
+
+
+@pytest.mark.parametrize(
+    "cls,expected",
+    [
+        pytest.param(ConcreteSource, True, id="valid"),
+        pytest.param(NotAnything, False, id="invalid"),
+        pytest.param(PartialSource, False, id="partial"),
+    ],
+)
+def test_source_interface_subclass_hook(cls, expected):
+    """Test that only complete Source implementations are recognized by the interface."""
+    assert issubclass(cls, SourceInterface) is expected
+
+
+def test_source_init_with_config(readonly_source):
+    """Test Source initialization with configuration."""
+    assert readonly_source._config == _SOURCE_CFG
+
+
+def test_source_init_without_config():
+    """Test Source initialization without configuration."""
+    source = ConcreteSource()
+    assert source._config is None
+
+
+def test_source_get_with_context():
+    """Test Source get method with context."""
+    source = ConcreteSource(_SOURCE_CFG)
+    context = _CTX_GET
+
+    result = source.get(context)
+
+    assert source.get_called
+    assert source.last_context == context
+    assert result["data"] == "retrieved"
+    assert result["context"] == context
+
+
+def test_source_get_without_context():
+    """Test Source get method without context."""
+    source = ConcreteSource()
+
+    result = source.get()
+
+    assert source.get_called
+    assert source.last_context is None
+    assert result["data"] == "retrieved"
+    assert result["context"] is None
+
+
+def test_source_get_raises_no_source_exception():
+    """Test Source get method can raise NoSourceException."""
+    source = FailingSource()
+    context = {"id": "missing"}
+
+    with pytest.raises(NoSourceException):
+        source.get(context)
+
+    assert source.get_called
+    assert source.last_context == context
+
+
+def test_source_list_with_context():
+    """Test Source list method with context."""
+    source = ConcreteSource()
+    context = {"prefix": "data/"}
+
+    result = source.list(context)
+
+    assert source.list_called
+    assert source.last_context == context
+    assert result == ["item1", "item2", "item3"]
+
+
+def test_source_list_without_context():
+    """Test Source list method without context."""
+    source = ConcreteSource()
+
+    result = source.list()
+
+    assert source.list_called
+    assert source.last_context is None
+    assert len(result) == 3
+
+
+def test_source_abstract_methods():
+    """Test that Source cannot be instantiated directly due to abstract methods."""
+    assert inspect.isabstract(Source)
+    assert Source.__abstractmethods__ == frozenset({"get", "list"})
+
+
+@pytest.mark.parametrize(
+    "config,context",
+    [
+        pytest.param({"input": "location"}, {"filter": "test"}, id="with_config_and_context"),
+        pytest.param(None, None, id="without_config_and_context"),
+    ],
+)
+def test_source_chain(config, context):
+    """Test SourceChain initialization, execution through get, and that it is both a Chain and a SourceInterface."""
+    chain = ConcreteSourceChain(config)
+    assert chain._config == config
+
+    result = chain.execute(context)
+
+    assert chain.get_called
+    assert result["chain_data"] == "success"
+    assert isinstance(chain, Chain)
+    assert issubclass(ConcreteSourceChain, SourceInterface)
+
+
+# ----- store -----
+
+_STORE_CFG = {"connection": "postgresql://localhost", "table": "data"}
+
+
+class ConcreteStore(Store):
+    """Concrete implementation of Store for testing."""
+
+    __slots__ = ("_config", "storage", "get_called", "delete_called", "save_called", "update_called")
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        super().__init__(config)
+        self.storage = {}
+        self.get_called = False
+        self.delete_called = False
+        self.save_called = False
+        self.update_called = False
+
+    def get(self, key: str, **kwargs) -> Any:
+        self.get_called = True
+        if key not in self.storage:
+            raise NoStoreException(f"Key '{key}' not found")
+        return self.storage[key]
+
+    def delete(self, key: str, **kwargs) -> None:
+        self.delete_called = True
+        if key in self.storage:
+            del self.storage[key]
+
+    def save(self, df: Any, key: str, **kwargs):
+        self.save_called = True
+        self.storage[key] = df
+        return key
+
+    def update(self, df: Any, key: str, **kwargs):
+        self.update_called = True
+        if key not in self.storage:
+            raise NoStoreException(f"Key '{key}' not found for update")
+        self.storage[key] = df
+        return key
+
+
+class PartialStore:
+    """Class that partially implements Store interface (missing update)."""
+
+    def get(self, key: str, **kwargs) -> Any:
+        return "data"
+
+    def delete(self, key: str, **kwargs) -> None:
+        pass
+
+    def save(self, df: Any, key: str, **kwargs):
+        pass
+
+
+@pytest.fixture
+def store():
+    """ConcreteStore for the tests that change it."""
+    return ConcreteStore()
+
+
+@pytest.fixture(scope="module")
+def readonly_store():
+    """ConcreteStore shared by the tests that only read it."""
+    return ConcreteStore(_STORE_CFG)
+
+
+def test_store_exception():
+    """Test StoreException is an exception carrying its message."""
+    assert issubclass(StoreException, Exception)
+    assert str(StoreException("test error")) == "test error"
+
+
+def test_no_store_exception():
+    """Test NoStoreException is an exception carrying its message."""
+    assert issubclass(NoStoreException, Exception)
+    assert str(NoStoreException("store not found")) == "store not found"
+
+
+def test_no_store_exception_is_store_exception():
+    """Test NoStoreException is a subclass of StoreException."""
+    assert issubclass(NoStoreException, StoreException)
+
+
+@pytest.mark.parametrize(
+    "cls,expected",
+    [
+        pytest.param(ConcreteStore, True, id="valid"),
+        pytest.param(NotAnything, False, id="invalid"),
+        pytest.param(PartialStore, False, id="partial"),
+    ],
+)
+def test_store_interface_subclass_hook(cls, expected):
+    """Test that only complete Store implementations are recognized by the interface."""
+    assert issubclass(cls, StoreInterface) is expected
+
+
+def test_store_init_with_config(readonly_store):
+    """Test Store initialization with configuration."""
+    assert readonly_store._config == _STORE_CFG
+
+
+def test_store_init_without_config(store):
+    """Test Store initialization without configuration."""
+    assert store._config is None
+
+
+def test_store_save(store, sample_payloads):
+    """Test Store save method."""
+    data = sample_payloads["small_list"]
+
+    result = store.save(data, "key1")
+
+    assert store.save_called
+    assert result == "key1"
+    assert store.storage["key1"] == data
+
+
+def test_store_get(store):
+    """Test Store get method."""
+    data = {"value": 100}
+    store.storage["key3"] = data
+
+    result = store.get("key3")
+
+    assert store.get_called
+    assert result == data
+
+
+@pytest.mark.parametrize(
+    "op,args,kwargs,expected_result,expected_storage",
+    [
+        pytest.param("save", ([1, 2, 3, 4, 5], "key"), {"overwrite": True, "compress": True}, "key", {"key": [1, 2, 3, 4, 5]}, id="save"),
+        pytest.param("get", ("key",), {"version": 2, "decrypt": True}, "old_data", {"key": "old_data"}, id="get"),
+        pytest.param("update", ("new_data", "key"), {"merge": True, "validate": True}, "key", {"key": "new_data"}, id="update"),
+        pytest.param("delete", ("key",), {"force": True, "recursive": True}, None, {}, id="delete"),
+    ],
+)
+def test_store_op_with_kwargs(store, op, args, kwargs, expected_result, expected_storage):
+    """Test Store methods accept additional kwargs."""
+    store.storage["key"] = "old_data"
+
+    result = getattr(store, op)(*args, **kwargs)
+
+    assert getattr(store, f"{op}_called")
+    assert result == expected_result
+    assert store.storage == expected_storage
+
+
+def test_store_get_raises_no_store_exception(store):
+    """Test Store get method raises NoStoreException for missing key."""
+
+    with pytest.raises(NoStoreException) as exc_info:
+        store.get("nonexistent_key")
+
+    assert "nonexistent_key" in str(exc_info.value)
+
+
+def test_store_update(store):
+    """Test Store update method."""
+    original_data = {"value": 10}
+    updated_data = {"value": 20}
+    store.storage["key5"] = original_data
+
+    result = store.update(updated_data, "key5")
+
+    assert store.update_called
+    assert result == "key5"
+    assert store.storage["key5"] == updated_data
+
+
+def test_store_update_raises_no_store_exception(store):
+    """Test Store update method raises NoStoreException for missing key."""
+    data = {"value": 30}
+
+    with pytest.raises(NoStoreException) as exc_info:
+        store.update(data, "nonexistent_key")
+
+    assert "nonexistent_key" in str(exc_info.value)
+
+
+def test_store_delete(store):
+    """Test Store delete method."""
+    store.storage["key7"] = "data_to_delete"
+
+    store.delete("key7")
+
+    assert store.delete_called
+    assert "key7" not in store.storage
+
+
+def test_store_delete_nonexistent_key(store):
+    """Test Store delete method with nonexistent key (no error)."""
+
+    store.delete("nonexistent_key")
+
+    assert store.delete_called
+
+
+def test_store_abstract_methods():
+    """Test that Store cannot be instantiated directly due to abstract methods."""
+    assert inspect.isabstract(Store)
+    assert Store.__abstractmethods__ == frozenset({"get", "delete", "save", "update"})
+
+
+def test_store_crud_workflow():
+    """Test complete CRUD workflow."""
+    store = ConcreteStore(_STORE_CFG)
+
+    # Create
+    data = {"id": 1, "name": "test_item"}
+    store.save(data, "item1")
+    assert "item1" in store.storage
+
+    # Read
+    retrieved = store.get("item1")
+    assert retrieved == data
+
+    # Update
+    updated_data = {"id": 1, "name": "updated_item"}
+    store.update(updated_data, "item1")
+    assert store.get("item1") == updated_data
+
+    # Delete
+    store.delete("item1")
+    with pytest.raises(NoStoreException):
+        store.get("item1")
+
+
+@pytest.mark.parametrize(
+    ("cls", "config"),
+    [
+        pytest.param(ConcreteSink, _SINK_CFG, id="sink"),
+        pytest.param(ConcreteSource, _SOURCE_CFG, id="source"),
+        pytest.param(FailingSource, _SOURCE_CFG, id="failing_source"),
+        pytest.param(ConcreteStore, _STORE_CFG, id="store"),
+    ],
+)
+def test_slotted_doubles_have_no_instance_dict(cls, config):
+    """Test the test doubles, which list every attribute they set in __slots__, carry no instance __dict__."""
+    instance = cls(config)
+
+    assert not hasattr(instance, "__dict__")
+    assert instance._config == config
+
+
+@pytest.mark.parametrize(
+    "bases",
+    [
+        pytest.param((Sink, Source), id="sink_source"),
+        pytest.param((Store, Source), id="store_source"),
+        pytest.param((ProcessorChain, Sink), id="processor_chain_sink"),
+        pytest.param((Processor, Store), id="processor_store"),
+        pytest.param((Etl, Sink), id="etl_sink"),
+    ],
+)
+def test_bases_can_be_combined(bases):
+    """Test an implementation can inherit from two of the abstract bases at once."""
+    combined = type("Combined", bases, {})
+
+    assert all(issubclass(combined, base) for base in bases)
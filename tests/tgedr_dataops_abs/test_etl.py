@@ -1,6 +1,9 @@
+import inspect
+import threading
+
 import pytest
 
-from tgedr_dataops_abs.etl import Etl, EtlException
+from tgedr_dataops_abs.etl import Etl, EtlException, _run_one
 
 
 class MyEtl(Etl):
@@ -164,3 +167,167 @@ def test_etl_cannot_instantiate_directly():
     """Test that Etl abstract class cannot be instantiated directly."""
     with pytest.raises(TypeError):
         Etl()
+
+
+def test_inject_configuration_resolves_signature_once(mocker):
+    """Test inject_configuration introspects the signature at decoration time only."""
+    signature_spy = mocker.spy(inspect, "signature")
+
+    class MyEtlWithCountedSignature(MyEtlWithMultipleParams):
+        @Etl.inject_configuration
+        def extract(self, param1, param2="default2") -> dict:
+            return {"param1": param1, "param2": param2}
+
+    etl = MyEtlWithCountedSignature({"param1": "value1"})
+    etl.extract()
+    etl.extract()
+
+    assert signature_spy.call_count == 1
+
+
+class MyPipelinedEtl(MyEtl):
+    def __init__(self, configuration=None, fail_on=None):
+        super().__init__(configuration)
+        self.fail_on = fail_on
+        self.loaded = []
+
+    def extract_iter(self):
+        for batch in range(self._configuration["batches"]):
+            if self.fail_on == ("extract", batch):
+                raise EtlException("extract failed")
+            yield batch
+
+    def transform_batch(self, batch):
+        if self.fail_on == ("transform", batch):
+            raise EtlException("transform failed")
+        return batch * 10
+
+    def load_batch(self, batch):
+        if self.fail_on == ("load", batch // 10):
+            raise EtlException("load failed")
+        self.loaded.append(batch)
+        return batch + 1
+
+
+def test_run_pipelined():
+    """Test run_pipelined extracts, transforms and loads every batch in order."""
+    etl = MyPipelinedEtl({"batches": 20})
+
+    result = etl.run_pipelined(prefetch=1)
+
+    assert etl.loaded == [batch * 10 for batch in range(20)]
+    assert result == [batch * 10 + 1 for batch in range(20)]
+
+
+@pytest.mark.parametrize("stage", ["extract", "transform", "load"])
+def test_run_pipelined_raises_stage_failure(stage):
+    """Test run_pipelined stops and raises the error of a failing stage."""
+    etl = MyPipelinedEtl({"batches": 20}, fail_on=(stage, 3))
+
+    with pytest.raises(EtlException, match=f"{stage} failed"):
+        etl.run_pipelined(prefetch=1)
+
+    assert etl.loaded[:3] == [0, 10, 20]
+    assert 30 not in etl.loaded
+
+
+class MyFailingLoadEtl(MyPipelinedEtl):
+    def __init__(self, configuration=None):
+        super().__init__(configuration)
+        self.transformed = []
+        self.third_transformed = threading.Event()
+
+    def transform_batch(self, batch):
+        self.transformed.append(batch)
+        if batch == 2:
+            self.third_transformed.set()
+        return batch * 10
+
+    def load_batch(self, batch):
+        # fails on the first batch once two more are transformed, the last one waiting to be queued
+        self.third_transformed.wait(timeout=5)
+        raise EtlException("load failed")
+
+
+def test_run_pipelined_stops_transform_after_failure():
+    """Test run_pipelined doesn't transform the batches still queued once a later stage fails."""
+    etl = MyFailingLoadEtl({"batches": 20})
+
+    with pytest.raises(EtlException, match="load failed"):
+        etl.run_pipelined(prefetch=1)
+
+    assert etl.transformed == [0, 1, 2]
+
+
+@pytest.mark.parametrize("prefetch", [0, -1])
+def test_run_pipelined_rejects_invalid_prefetch(prefetch):
+    """Test run_pipelined requires room for at least one batch between stages."""
+    etl = MyPipelinedEtl({"batches": 2})
+
+    with pytest.raises(EtlException, match="prefetch must be at least 1"):
+        etl.run_pipelined(prefetch=prefetch)
+
+
+def test_run_pipelined_requires_batch_hooks():
+    """Test the batch hooks used by run_pipelined are not implemented by default."""
+    etl = MyEtl({"input": 3})
+
+    with pytest.raises(NotImplementedError):
+        etl.run_pipelined()
+    with pytest.raises(NotImplementedError):
+        etl.transform_batch(1)
+    with pytest.raises(NotImplementedError):
+        etl.load_batch(1)
+
+
+class MySlottedEtl(Etl):
+    __slots__ = ("_configuration",)
+
+    @Etl.inject_configuration
+    def extract(self, input) -> None:
+        return input
+
+    def transform(self) -> None:
+        pass
+
+    def load(self) -> None:
+        pass
+
+
+def test_slotted_etl_has_no_instance_dict():
+    """Test Etl subclasses declaring __slots__ don't carry an instance __dict__."""
+    etl = MySlottedEtl({"input": 3})
+
+    assert not hasattr(etl, "__dict__")
+    assert 3 == etl.extract()
+
+
+def test_inject_configuration_reads_current_configuration():
+    """Test inject_configuration resolves parameters from the configuration as it is at each call."""
+    config = {"param1": "value1"}
+    etl = MyEtlWithMultipleParams(config)
+    assert etl.extract()["param2"] == "default2"
+
+    config["param2"] = "custom2"
+    assert etl.extract()["param2"] == "custom2"
+
+    etl._configuration = {"param1": "other1"}
+    assert etl.extract() == {"param1": "other1", "param2": "default2", "param3": None}
+
+
+def test_run_many():
+    """Test run_many runs the ETL once per configuration, keeping their order."""
+    result = MyEtlWithValidation.run_many([{"source": "database"}, {"source": "files"}, {"source": "api"}], max_workers=2)
+
+    assert result == ["DATA FROM DATABASE", "DATA FROM FILES", "DATA FROM API"]
+
+
+def test_run_many_raises_run_failure():
+    """Test run_many raises the error of a failed run."""
+    with pytest.raises(EtlException, match="required_param"):
+        MyEtlWithMissingParam.run_many([{"required_param": 1}, {}])
+
+
+def test_run_one():
+    """Test the run_many worker runs a new instance with the given configuration."""
+    assert _run_one((MyEtlWithValidation, {"source": "database"})) == "DATA FROM DATABASE"
@@ -1,20 +1,43 @@
 """Unit tests for Great Expectations validation module."""
 
+from concurrent.futures import ThreadPoolExecutor
+import copy
+from types import SimpleNamespace
+
 import pytest
-from unittest.mock import Mock, MagicMock, patch
+from unittest.mock import Mock, MagicMock, call, patch
 
-import great_expectations as gx
-from great_expectations.expectations.expectation_configuration import ExpectationConfiguration
-from great_expectations.core.batch import Batch
 from great_expectations.execution_engine import ExecutionEngine
-from great_expectations.validator.validator import Validator
 
 from tgedr_dataops_abs.great_expectations_validation import (
     ValidationError,
     GreatExpectationsValidation,
+    _get_worker_validation,
 )
 
 
+_EXP_COL_EXISTS = {"expectation_type": "expect_column_to_exist", "kwargs": {"column": "id"}}
+_EXP_NOT_NULL = {"expectation_type": "expect_column_values_to_not_be_null", "kwargs": {"column": "name"}}
+
+# expectations payloads shared by the tests, validate must not change them
+_NO_EXPECTATIONS = {"expectations": []}
+_SUITE_EMPTY = {"expectation_suite_name": "test_suite", "expectations": []}
+_SUITE_SINGLE = {"expectation_suite_name": "test_suite", "expectations": [_EXP_COL_EXISTS]}
+_SUITE_DOUBLE = {"expectation_suite_name": "test_suite", "expectations": [_EXP_COL_EXISTS, _EXP_NOT_NULL]}
+
+
+class EchoValidation(GreatExpectationsValidation):
+    """Module level implementation, so that it can be used in real worker processes."""
+
+    def validate(self, df, expectations):
+        """Return the dataframe instead of validating it."""
+        return {"success": True, "df": df}
+
+    def _get_execution_engine(self, batch_data_dict: dict) -> ExecutionEngine:
+        """Not used, validate doesn't need an engine."""
+        raise NotImplementedError
+
+
 class ConcreteGreatExpectationsValidation(GreatExpectationsValidation):
     """Concrete implementation for testing purposes."""
 
@@ -27,11 +50,63 @@ class ConcreteGreatExpectationsValidation(GreatExpectationsValidation):
         if self._execution_engine:
             return self._execution_engine
         # Return a mock engine
-        engine = Mock(spec=ExecutionEngine)
+        engine = Mock()
         engine.batch_manager = Mock()
         return engine
 
 
+@pytest.fixture(scope="session")
+def gx_specs():
+    """Attribute names of the mocked Great Expectations classes, introspected once per session."""
+    from great_expectations.validator.validator import Validator
+
+    return SimpleNamespace(validator=dir(Validator))
+
+
+@pytest.fixture
+def mock_execution_engine():
+    """Create a mock execution engine."""
+    engine = Mock()
+    engine.batch_manager = Mock()
+    return engine
+
+
+@pytest.fixture
+def mock_validator(gx_specs):
+    """Create a mock validator, spec'd so that assertions on misspelled methods fail."""
+    return Mock(spec=gx_specs.validator)
+
+
+@pytest.fixture
+def mock_batch():
+    """Create a mock batch."""
+    return Mock()
+
+
+@pytest.fixture
+def patched_gx(monkeypatch, mock_validator, mock_batch):
+    """Patch the Great Expectations classes used by validate, handing out the mock validator and batch."""
+    mocks = SimpleNamespace(
+        batch=MagicMock(return_value=mock_batch),
+        validator=MagicMock(return_value=mock_validator),
+        expectation_configuration=MagicMock(),
+        gx=MagicMock(),
+    )
+    mocks.get_context = mocks.gx.get_context
+    mocks.suite = mocks.gx.ExpectationSuite
+    monkeypatch.setattr("tgedr_dataops_abs.great_expectations_validation.Batch", mocks.batch)
+    monkeypatch.setattr("tgedr_dataops_abs.great_expectations_validation.Validator", mocks.validator)
+    monkeypatch.setattr("tgedr_dataops_abs.great_expectations_validation.ExpectationConfiguration", mocks.expectation_configuration)
+    monkeypatch.setattr("tgedr_dataops_abs.great_expectations_validation.gx", mocks.gx)
+    return mocks
+
+
+@pytest.fixture(autouse=True)
+def process_context(monkeypatch):
+    """Start every test without the data context kept by the module."""
+    monkeypatch.setattr("tgedr_dataops_abs.great_expectations_validation._CONTEXT", None)
+
+
 class TestValidationError:
     """Tests for ValidationError exception."""
 
@@ -59,35 +134,107 @@ class TestValidationError:
 class TestGreatExpectationsValidation:
     """Tests for GreatExpectationsValidation abstract class."""
 
+    @pytest.fixture(scope="class")
+    def impl(self):
+        """Create one concrete implementation, shared by the tests that only inspect it."""
+        return ConcreteGreatExpectationsValidation()
+
     def test_is_abstract_class(self):
         """Test that GreatExpectationsValidation is abstract."""
         with pytest.raises(TypeError, match="Can't instantiate abstract class"):
             GreatExpectationsValidation()
 
-    def test_concrete_implementation_can_be_instantiated(self):
+    def test_concrete_implementation_can_be_instantiated(self, impl):
         """Test that a concrete implementation can be instantiated."""
-        impl = ConcreteGreatExpectationsValidation()
         assert isinstance(impl, GreatExpectationsValidation)
 
-    def test_has_validate_method(self):
+    def test_has_validate_method(self, impl):
         """Test that the class has a validate method."""
-        impl = ConcreteGreatExpectationsValidation()
         assert hasattr(impl, "validate")
         assert callable(impl.validate)
 
-    def test_has_get_execution_engine_method(self):
+    def test_has_get_execution_engine_method(self, impl):
         """Test that the class has _get_execution_engine method."""
-        impl = ConcreteGreatExpectationsValidation()
         assert hasattr(impl, "_get_execution_engine")
         assert callable(impl._get_execution_engine)
 
 
+def _assert_expectations_added(patched_gx, df):
+    """Check that both expectations of the `adds_expectations` case were configured and handed to the suite."""
+    patched_gx.expectation_configuration.assert_has_calls(
+        [
+            call(type="expect_column_to_exist", kwargs={"column": "id"}),
+            call(type="expect_column_values_to_not_be_null", kwargs={"column": "name"}),
+        ],
+        any_order=True,
+    )
+    assert patched_gx.expectation_configuration.call_count == 2
+    domain_obj = patched_gx.expectation_configuration.return_value.to_domain_obj.return_value
+    patched_gx.suite.assert_called_once_with(name="test_suite", expectations=[domain_obj] * 2)
+
+
+VALIDATE_CASES = [
+    pytest.param(
+        _SUITE_SINGLE,
+        lambda patched_gx, df: patched_gx.batch.assert_called_once_with(data=df),
+        id="creates_batch",
+    ),
+    pytest.param(
+        {"expectation_suite_name": "custom_suite_name", "expectations": []},
+        lambda patched_gx, df: patched_gx.suite.assert_called_once_with(name="custom_suite_name", expectations=[]),
+        id="creates_expectation_suite",
+    ),
+    pytest.param(
+        _NO_EXPECTATIONS,
+        lambda patched_gx, df: patched_gx.suite.assert_called_once_with(name="validation_suite", expectations=[]),
+        id="default_suite_name",
+    ),
+    pytest.param(
+        _SUITE_DOUBLE,
+        _assert_expectations_added,
+        id="adds_expectations",
+    ),
+    pytest.param(
+        {"expectation_suite_name": "empty_suite", "expectations": []},
+        lambda patched_gx, df: patched_gx.suite.assert_called_once_with(name="empty_suite", expectations=[]),
+        id="empty_expectations",
+    ),
+    pytest.param(
+        {"expectation_suite_name": "suite_without_expectations"},
+        lambda patched_gx, df: patched_gx.suite.assert_called_once_with(
+            name="suite_without_expectations", expectations=[]
+        ),
+        id="missing_expectations_key",
+    ),
+    pytest.param(
+        {"expectation_suite_name": "test_suite", "expectations": [{"expectation_type": "expect_table_row_count_to_be_between"}]},
+        lambda patched_gx, df: patched_gx.expectation_configuration.assert_called_once_with(
+            type="expect_table_row_count_to_be_between", kwargs={}
+        ),
+        id="expectation_without_kwargs",
+    ),
+    pytest.param(
+        _NO_EXPECTATIONS,
+        lambda patched_gx, df: patched_gx.get_context.assert_called_once_with(mode="ephemeral"),
+        id="ephemeral_context",
+    ),
+]
+
+
 class TestValidateMethod:
     """Tests for the validate method."""
 
     @pytest.fixture
-    def mock_validator_result(self):
-        """Create a mock validation result."""
+    def trivial_result(self):
+        """Create a mock successful validation result, for tests that don't look into it."""
+        result = Mock()
+        result.success = True
+        result.to_json_dict.return_value = {"success": True}
+        return result
+
+    @pytest.fixture
+    def detailed_result(self):
+        """Create a mock validation result with a complete JSON dict."""
         result = Mock()
         result.success = True
         result.to_json_dict.return_value = {
@@ -102,446 +249,274 @@ class TestValidateMethod:
         return result
 
     @pytest.fixture
-    def mock_execution_engine(self):
-        """Create a mock execution engine."""
-        engine = Mock(spec=ExecutionEngine)
-        engine.batch_manager = Mock()
-        return engine
-
-    def test_validate_creates_batch(self, mock_validator_result, mock_execution_engine):
-        """Test that validate creates a Batch object from the dataframe."""
+    def wired_gx(self, patched_gx, mock_validator, trivial_result):
+        """Patch the Great Expectations classes, with the mock validator returning a successful result."""
+        mock_validator.validate.return_value = trivial_result
+        return patched_gx
+
+    @pytest.mark.parametrize("expectations,assertion", VALIDATE_CASES)
+    def test_validate_behavior(self, wired_gx, mock_execution_engine, expectations, assertion):
+        """Test how validate hands the dataframe and expectations over to Great Expectations."""
         impl = ConcreteGreatExpectationsValidation(mock_execution_engine)
         df = Mock()
-        expectations = {
-            "expectation_suite_name": "test_suite",
-            "expectations": [
-                {
-                    "expectation_type": "expect_column_to_exist",
-                    "kwargs": {"column": "id"},
-                }
-            ],
-        }
-
-        with patch("tgedr_dataops_abs.great_expectations_validation.Batch") as mock_batch_class, \
-             patch("tgedr_dataops_abs.great_expectations_validation.gx.get_context") as mock_context, \
-             patch("tgedr_dataops_abs.great_expectations_validation.gx.ExpectationSuite") as mock_suite_class, \
-             patch("tgedr_dataops_abs.great_expectations_validation.Validator") as mock_validator_class:
-
-            mock_batch = Mock(spec=Batch)
-            mock_batch.id = "batch_id"
-            mock_batch.data = df
-            mock_batch_class.return_value = mock_batch
-
-            mock_suite = Mock()
-            mock_suite_class.return_value = mock_suite
 
-            mock_validator = Mock(spec=Validator)
-            mock_validator.validate.return_value = mock_validator_result
-            mock_validator_class.return_value = mock_validator
+        result = impl.validate(df, expectations)
 
-            mock_ctx = Mock()
-            mock_context.return_value = mock_ctx
+        assertion(wired_gx, df)
+        assert result["success"] is True
 
-            result = impl.validate(df, expectations)
-
-            # Verify Batch was created with the dataframe
-            mock_batch_class.assert_called_once_with(data=df)
-            assert result["success"] is True
-
-    def test_validate_creates_expectation_suite(self, mock_validator_result, mock_execution_engine):
-        """Test that validate creates an ExpectationSuite with correct name."""
+    def test_validate_creates_validator_with_correct_parameters(self, wired_gx, mock_execution_engine, mock_batch):
+        """Test that validate creates a Validator with correct parameters."""
         impl = ConcreteGreatExpectationsValidation(mock_execution_engine)
         df = Mock()
-        suite_name = "custom_suite_name"
-        expectations = {
-            "expectation_suite_name": suite_name,
-            "expectations": [],
-        }
+        expectations = _SUITE_SINGLE
 
-        with patch("tgedr_dataops_abs.great_expectations_validation.Batch"), \
-             patch("tgedr_dataops_abs.great_expectations_validation.gx.get_context") as mock_context, \
-             patch("tgedr_dataops_abs.great_expectations_validation.gx.ExpectationSuite") as mock_suite_class, \
-             patch("tgedr_dataops_abs.great_expectations_validation.Validator") as mock_validator_class:
+        impl.validate(df, expectations)
 
-            mock_suite = Mock()
-            mock_suite_class.return_value = mock_suite
+        # Verify Validator was created with correct parameters
+        wired_gx.validator.assert_called_once()
+        call_kwargs = wired_gx.validator.call_args[1]
+        assert call_kwargs["execution_engine"] == mock_execution_engine
+        assert call_kwargs["batches"] == [mock_batch]
+        assert call_kwargs["expectation_suite"] == wired_gx.suite.return_value
+        assert call_kwargs["data_context"] == wired_gx.get_context.return_value
 
-            mock_validator = Mock(spec=Validator)
-            mock_validator.validate.return_value = mock_validator_result
-            mock_validator_class.return_value = mock_validator
-
-            mock_ctx = Mock()
-            mock_context.return_value = mock_ctx
-
-            impl.validate(df, expectations)
-
-            # Verify ExpectationSuite was created with correct name
-            mock_suite_class.assert_called_once_with(name=suite_name)
-
-    def test_validate_uses_default_suite_name(self, mock_validator_result, mock_execution_engine):
-        """Test that validate uses default suite name when not provided."""
+    def test_validate_calls_get_execution_engine(self, monkeypatch, wired_gx, mock_batch, mock_execution_engine):
+        """Test that validate calls _get_execution_engine with batch data."""
         impl = ConcreteGreatExpectationsValidation(mock_execution_engine)
         df = Mock()
-        expectations = {"expectations": []}  # No suite name provided
-
-        with patch("tgedr_dataops_abs.great_expectations_validation.Batch"), \
-             patch("tgedr_dataops_abs.great_expectations_validation.gx.get_context") as mock_context, \
-             patch("tgedr_dataops_abs.great_expectations_validation.gx.ExpectationSuite") as mock_suite_class, \
-             patch("tgedr_dataops_abs.great_expectations_validation.Validator") as mock_validator_class:
-
-            mock_suite = Mock()
-            mock_suite_class.return_value = mock_suite
+        expectations = _SUITE_EMPTY
+        mock_batch.id = "test_batch_id"
+        mock_batch.data = df
 
-            mock_validator = Mock(spec=Validator)
-            mock_validator.validate.return_value = mock_validator_result
-            mock_validator_class.return_value = mock_validator
+        monkeypatch.setattr(impl, "_get_execution_engine", mock_get_engine := Mock(wraps=impl._get_execution_engine))
 
-            mock_ctx = Mock()
-            mock_context.return_value = mock_ctx
-
-            impl.validate(df, expectations)
+        impl.validate(df, expectations)
 
-            # Verify default suite name was used
-            mock_suite_class.assert_called_once_with(name="validation_suite")
+        # Verify _get_execution_engine was called with correct batch data dict
+        mock_get_engine.assert_called_once()
+        call_kwargs = mock_get_engine.call_args[1]
+        assert "batch_data_dict" in call_kwargs
+        assert "test_batch_id" in call_kwargs["batch_data_dict"]
+        assert call_kwargs["batch_data_dict"]["test_batch_id"] == df
 
-    def test_validate_adds_expectations_to_suite(self, mock_validator_result, mock_execution_engine):
-        """Test that validate adds expectations to the suite."""
+    def test_validate_runs_validation(self, wired_gx, mock_execution_engine, mock_validator):
+        """Test that validate runs the validation."""
         impl = ConcreteGreatExpectationsValidation(mock_execution_engine)
         df = Mock()
-        expectations = {
-            "expectation_suite_name": "test_suite",
-            "expectations": [
-                {
-                    "expectation_type": "expect_column_to_exist",
-                    "kwargs": {"column": "id"},
-                },
-                {
-                    "expectation_type": "expect_column_values_to_not_be_null",
-                    "kwargs": {"column": "name"},
-                },
-            ],
-        }
-
-        with patch("tgedr_dataops_abs.great_expectations_validation.Batch"), \
-             patch("tgedr_dataops_abs.great_expectations_validation.gx.get_context") as mock_context, \
-             patch("tgedr_dataops_abs.great_expectations_validation.gx.ExpectationSuite") as mock_suite_class, \
-             patch("tgedr_dataops_abs.great_expectations_validation.ExpectationConfiguration") as mock_exp_config_class, \
-             patch("tgedr_dataops_abs.great_expectations_validation.Validator") as mock_validator_class:
-
-            mock_suite = Mock()
-            mock_suite_class.return_value = mock_suite
+        expectations = _SUITE_EMPTY
 
-            mock_exp_config = Mock()
-            mock_exp_config_class.return_value = mock_exp_config
+        impl.validate(df, expectations)
 
-            mock_validator = Mock(spec=Validator)
-            mock_validator.validate.return_value = mock_validator_result
-            mock_validator_class.return_value = mock_validator
+        # Verify validate was called with only_return_failures=True
+        mock_validator.validate.assert_called_once_with(only_return_failures=True)
 
-            mock_ctx = Mock()
-            mock_context.return_value = mock_ctx
-
-            impl.validate(df, expectations)
-
-            # Verify expectations were added to the suite
-            assert mock_suite.add_expectation_configuration.call_count == 2
-            assert mock_exp_config_class.call_count == 2
-
-            # Verify first expectation
-            first_call = mock_exp_config_class.call_args_list[0]
-            assert first_call[1]["type"] == "expect_column_to_exist"
-            assert first_call[1]["kwargs"] == {"column": "id"}
-
-            # Verify second expectation
-            second_call = mock_exp_config_class.call_args_list[1]
-            assert second_call[1]["type"] == "expect_column_values_to_not_be_null"
-            assert second_call[1]["kwargs"] == {"column": "name"}
-
-    def test_validate_creates_validator_with_correct_parameters(self, mock_validator_result, mock_execution_engine):
-        """Test that validate creates a Validator with correct parameters."""
+    def test_validate_returns_json_dict_result(self, patched_gx, mock_validator, detailed_result, mock_execution_engine):
+        """Test that validate returns the JSON dict from validation result."""
         impl = ConcreteGreatExpectationsValidation(mock_execution_engine)
         df = Mock()
-        expectations = {
-            "expectation_suite_name": "test_suite",
-            "expectations": [
-                {
-                    "expectation_type": "expect_column_to_exist",
-                    "kwargs": {"column": "id"},
-                }
-            ],
-        }
-
-        with patch("tgedr_dataops_abs.great_expectations_validation.Batch") as mock_batch_class, \
-             patch("tgedr_dataops_abs.great_expectations_validation.gx.get_context") as mock_context, \
-             patch("tgedr_dataops_abs.great_expectations_validation.gx.ExpectationSuite") as mock_suite_class, \
-             patch("tgedr_dataops_abs.great_expectations_validation.Validator") as mock_validator_class:
+        expectations = _SUITE_EMPTY
+        mock_validator.validate.return_value = detailed_result
 
-            mock_batch = Mock(spec=Batch)
-            mock_batch.id = "batch_id"
-            mock_batch.data = df
-            mock_batch_class.return_value = mock_batch
+        result = impl.validate(df, expectations)
 
-            mock_suite = Mock()
-            mock_suite_class.return_value = mock_suite
+        # Verify to_json_dict was called
+        detailed_result.to_json_dict.assert_called_once()
 
-            mock_validator = Mock(spec=Validator)
-            mock_validator.validate.return_value = mock_validator_result
-            mock_validator_class.return_value = mock_validator
+        # Verify result is the JSON dict
+        expected_result = detailed_result.to_json_dict.return_value
+        assert result == expected_result
+        assert result["success"] is True
 
-            mock_ctx = Mock()
-            mock_context.return_value = mock_ctx
+    def test_validate_raises_validation_error_on_exception(self, patched_gx, mock_execution_engine):
+        """Test that validate raises ValidationError when an exception occurs."""
+        impl = ConcreteGreatExpectationsValidation(mock_execution_engine)
+        df = Mock()
+        expectations = _NO_EXPECTATIONS
+        patched_gx.batch.side_effect = RuntimeError("Test error")
 
+        with pytest.raises(ValidationError, match="failed data expectations"):
             impl.validate(df, expectations)
 
-            # Verify Validator was created with correct parameters
-            mock_validator_class.assert_called_once()
-            call_kwargs = mock_validator_class.call_args[1]
-            assert call_kwargs["execution_engine"] == mock_execution_engine
-            assert call_kwargs["batches"] == [mock_batch]
-            assert call_kwargs["expectation_suite"] == mock_suite
-            assert call_kwargs["data_context"] == mock_ctx
-
-    def test_validate_calls_get_execution_engine(self, mock_validator_result):
-        """Test that validate calls _get_execution_engine with batch data."""
-        mock_engine = Mock(spec=ExecutionEngine)
-        mock_engine.batch_manager = Mock()
-        impl = ConcreteGreatExpectationsValidation(mock_engine)
+    def test_validate_wraps_original_exception(self, patched_gx, mock_execution_engine):
+        """Test that validate wraps the original exception in ValidationError."""
+        impl = ConcreteGreatExpectationsValidation(mock_execution_engine)
         df = Mock()
-        expectations = {
-            "expectation_suite_name": "test_suite",
-            "expectations": [],
-        }
-
-        with patch("tgedr_dataops_abs.great_expectations_validation.Batch") as mock_batch_class, \
-             patch("tgedr_dataops_abs.great_expectations_validation.gx.get_context") as mock_context, \
-             patch("tgedr_dataops_abs.great_expectations_validation.gx.ExpectationSuite"), \
-             patch("tgedr_dataops_abs.great_expectations_validation.Validator") as mock_validator_class:
-
-            mock_batch = Mock(spec=Batch)
-            mock_batch.id = "test_batch_id"
-            mock_batch.data = df
-            mock_batch_class.return_value = mock_batch
-
-            mock_validator = Mock(spec=Validator)
-            mock_validator.validate.return_value = mock_validator_result
-            mock_validator_class.return_value = mock_validator
-
-            mock_ctx = Mock()
-            mock_context.return_value = mock_ctx
+        expectations = _NO_EXPECTATIONS
+        original_error = RuntimeError("Original test error")
+        patched_gx.batch.side_effect = original_error
 
-            with patch.object(impl, "_get_execution_engine", wraps=impl._get_execution_engine) as mock_get_engine:
-                impl.validate(df, expectations)
+        with pytest.raises(ValidationError) as exc_info:
+            impl.validate(df, expectations)
 
-                # Verify _get_execution_engine was called with correct batch data dict
-                mock_get_engine.assert_called_once()
-                call_kwargs = mock_get_engine.call_args[1]
-                assert "batch_data_dict" in call_kwargs
-                assert "test_batch_id" in call_kwargs["batch_data_dict"]
-                assert call_kwargs["batch_data_dict"]["test_batch_id"] == df
+        # Verify original exception is wrapped
+        assert exc_info.value.__cause__ is original_error
 
-    def test_validate_runs_validation(self, mock_validator_result, mock_execution_engine):
-        """Test that validate runs the validation."""
+    def test_validate_raises_validation_error_on_invalid_expectation(self, monkeypatch, mock_execution_engine):
+        """Test that validate raises ValidationError for an unknown expectation type."""
         impl = ConcreteGreatExpectationsValidation(mock_execution_engine)
         df = Mock()
-        expectations = {
-            "expectation_suite_name": "test_suite",
-            "expectations": [],
-        }
-
-        with patch("tgedr_dataops_abs.great_expectations_validation.Batch"), \
-             patch("tgedr_dataops_abs.great_expectations_validation.gx.get_context") as mock_context, \
-             patch("tgedr_dataops_abs.great_expectations_validation.gx.ExpectationSuite"), \
-             patch("tgedr_dataops_abs.great_expectations_validation.Validator") as mock_validator_class:
+        expectations = {"expectations": [{"expectation_type": "expect_something_unknown", "kwargs": {}}]}
 
-            mock_validator = Mock(spec=Validator)
-            mock_validator.validate.return_value = mock_validator_result
-            mock_validator_class.return_value = mock_validator
-
-            mock_ctx = Mock()
-            mock_context.return_value = mock_ctx
+        monkeypatch.setattr("tgedr_dataops_abs.great_expectations_validation.Batch", Mock())
 
+        with pytest.raises(ValidationError, match="expect_something_unknown"):
             impl.validate(df, expectations)
 
-            # Verify validate was called with only_return_failures=True
-            mock_validator.validate.assert_called_once_with(only_return_failures=True)
-
-    def test_validate_returns_json_dict_result(self, mock_validator_result, mock_execution_engine):
-        """Test that validate returns the JSON dict from validation result."""
+    def test_validate_reuses_suite_for_same_expectations(self, wired_gx, mock_execution_engine):
+        """Test that validate builds the suite only once for the same expectations."""
         impl = ConcreteGreatExpectationsValidation(mock_execution_engine)
         df = Mock()
-        expectations = {
-            "expectation_suite_name": "test_suite",
-            "expectations": [],
-        }
+        expectations = _SUITE_SINGLE
 
-        with patch("tgedr_dataops_abs.great_expectations_validation.Batch"), \
-             patch("tgedr_dataops_abs.great_expectations_validation.gx.get_context") as mock_context, \
-             patch("tgedr_dataops_abs.great_expectations_validation.gx.ExpectationSuite"), \
-             patch("tgedr_dataops_abs.great_expectations_validation.Validator") as mock_validator_class:
+        impl.validate(df, expectations)
+        impl.validate(df, dict(expectations))
 
-            mock_validator = Mock(spec=Validator)
-            mock_validator.validate.return_value = mock_validator_result
-            mock_validator_class.return_value = mock_validator
+        # Verify the suite and context were built once and used by both validators
+        wired_gx.suite.assert_called_once()
+        wired_gx.get_context.assert_called_once_with(mode="ephemeral")
+        assert wired_gx.validator.call_count == 2
+        for validator_call in wired_gx.validator.call_args_list:
+            assert validator_call[1]["expectation_suite"] == wired_gx.suite.return_value
+            assert validator_call[1]["data_context"] == wired_gx.get_context.return_value
 
-            mock_ctx = Mock()
-            mock_context.return_value = mock_ctx
+    def test_validate_leaves_expectations_unchanged(self, monkeypatch, wired_gx, mock_execution_engine):
+        """Test that validate does not change the expectations it is given, so tests can share them."""
+        from great_expectations.expectations.expectation_configuration import ExpectationConfiguration
 
-            result = impl.validate(df, expectations)
+        monkeypatch.setattr(
+            "tgedr_dataops_abs.great_expectations_validation.ExpectationConfiguration", ExpectationConfiguration
+        )
+        snapshot = copy.deepcopy(_SUITE_DOUBLE)
 
-            # Verify to_json_dict was called
-            mock_validator_result.to_json_dict.assert_called_once()
+        ConcreteGreatExpectationsValidation(mock_execution_engine).validate(Mock(), _SUITE_DOUBLE)
 
-            # Verify result is the JSON dict
-            expected_result = mock_validator_result.to_json_dict.return_value
-            assert result == expected_result
-            assert result["success"] is True
+        assert _SUITE_DOUBLE == snapshot
 
-    def test_validate_raises_validation_error_on_exception(self, mock_execution_engine):
-        """Test that validate raises ValidationError when an exception occurs."""
-        impl = ConcreteGreatExpectationsValidation(mock_execution_engine)
+    def test_validate_shares_context_across_instances(self, wired_gx, mock_execution_engine):
+        """Test that validations of different instances use the same ephemeral context."""
         df = Mock()
-        expectations = {"expectations": []}
+        expectations = _NO_EXPECTATIONS
 
-        with patch("tgedr_dataops_abs.great_expectations_validation.Batch", side_effect=RuntimeError("Test error")):
-            with pytest.raises(ValidationError, match="failed data expectations"):
-                impl.validate(df, expectations)
+        ConcreteGreatExpectationsValidation(mock_execution_engine).validate(df, expectations)
+        ConcreteGreatExpectationsValidation(mock_execution_engine).validate(df, expectations)
 
-    def test_validate_wraps_original_exception(self, mock_execution_engine):
-        """Test that validate wraps the original exception in ValidationError."""
+        # Verify the context was created once and handed to both validators
+        wired_gx.get_context.assert_called_once_with(mode="ephemeral")
+        for validator_call in wired_gx.validator.call_args_list:
+            assert validator_call[1]["data_context"] == wired_gx.get_context.return_value
+
+    def test_validate_rebuilds_suite_for_changed_expectations(self, wired_gx, mock_execution_engine):
+        """Test that validate builds a new suite when the expectations change."""
         impl = ConcreteGreatExpectationsValidation(mock_execution_engine)
         df = Mock()
-        expectations = {"expectations": []}
+        expectations = dict(_SUITE_EMPTY)
 
-        original_error = RuntimeError("Original test error")
-        with patch("tgedr_dataops_abs.great_expectations_validation.Batch", side_effect=original_error):
-            with pytest.raises(ValidationError) as exc_info:
-                impl.validate(df, expectations)
+        impl.validate(df, expectations)
+        expectations["expectation_suite_name"] = "other_suite"
+        impl.validate(df, expectations)
 
-            # Verify original exception is wrapped
-            assert exc_info.value.__cause__ is original_error
+        # Verify a suite was built for each version of the expectations
+        assert wired_gx.suite.call_args_list[0][1] == {"name": "test_suite", "expectations": []}
+        assert wired_gx.suite.call_args_list[1][1] == {"name": "other_suite", "expectations": []}
 
-    def test_validate_handles_empty_expectations_list(self, mock_validator_result, mock_execution_engine):
-        """Test that validate handles empty expectations list."""
+    def test_validate_builds_suite_for_unserializable_expectations(self, wired_gx, mock_execution_engine):
+        """Test that validate builds the suite on every call when expectations are not JSON serializable."""
         impl = ConcreteGreatExpectationsValidation(mock_execution_engine)
         df = Mock()
         expectations = {
-            "expectation_suite_name": "empty_suite",
-            "expectations": [],  # Empty list
+            "expectation_suite_name": "test_suite",
+            "expectations": [
+                {
+                    "expectation_type": "expect_column_values_to_be_in_set",
+                    "kwargs": {"column": "id", "value_set": {1, 2}},
+                }
+            ],
         }
 
-        with patch("tgedr_dataops_abs.great_expectations_validation.Batch"), \
-             patch("tgedr_dataops_abs.great_expectations_validation.gx.get_context") as mock_context, \
-             patch("tgedr_dataops_abs.great_expectations_validation.gx.ExpectationSuite") as mock_suite_class, \
-             patch("tgedr_dataops_abs.great_expectations_validation.Validator") as mock_validator_class:
-
-            mock_suite = Mock()
-            mock_suite_class.return_value = mock_suite
+        impl.validate(df, expectations)
+        impl.validate(df, expectations)
 
-            mock_validator = Mock(spec=Validator)
-            mock_validator.validate.return_value = mock_validator_result
-            mock_validator_class.return_value = mock_validator
+        # Verify the suite was not cached
+        assert wired_gx.suite.call_count == 2
 
-            mock_ctx = Mock()
-            mock_context.return_value = mock_ctx
-
-            result = impl.validate(df, expectations)
-
-            # Verify no expectations were added
-            mock_suite.add_expectation_configuration.assert_not_called()
-            assert result["success"] is True
-
-    def test_validate_handles_missing_expectations_key(self, mock_validator_result, mock_execution_engine):
-        """Test that validate handles missing 'expectations' key."""
+    def test_validate_evicts_least_recently_used_suite(self, wired_gx, mock_execution_engine, monkeypatch):
+        """Test that validate keeps a bounded number of suites, evicting the least recently used one."""
+        monkeypatch.setattr("tgedr_dataops_abs.great_expectations_validation._SUITE_CACHE_SIZE", 2)
         impl = ConcreteGreatExpectationsValidation(mock_execution_engine)
         df = Mock()
-        expectations = {
-            "expectation_suite_name": "suite_without_expectations"
-            # No 'expectations' key
-        }
 
-        with patch("tgedr_dataops_abs.great_expectations_validation.Batch"), \
-             patch("tgedr_dataops_abs.great_expectations_validation.gx.get_context") as mock_context, \
-             patch("tgedr_dataops_abs.great_expectations_validation.gx.ExpectationSuite") as mock_suite_class, \
-             patch("tgedr_dataops_abs.great_expectations_validation.Validator") as mock_validator_class:
+        impl.validate(df, _SUITE_EMPTY)
+        impl.validate(df, _SUITE_SINGLE)
+        impl.validate(df, _SUITE_EMPTY)
+        impl.validate(df, _SUITE_DOUBLE)
+        assert wired_gx.suite.call_count == 3
 
-            mock_suite = Mock()
-            mock_suite_class.return_value = mock_suite
+        # Verify the single expectation suite was evicted, while the recently used ones are kept
+        impl.validate(df, _SUITE_EMPTY)
+        impl.validate(df, _SUITE_DOUBLE)
+        assert wired_gx.suite.call_count == 3
+        impl.validate(df, _SUITE_SINGLE)
+        assert wired_gx.suite.call_count == 4
+        assert len(impl._suite_cache) == 2
 
-            mock_validator = Mock(spec=Validator)
-            mock_validator.validate.return_value = mock_validator_result
-            mock_validator_class.return_value = mock_validator
-
-            mock_ctx = Mock()
-            mock_context.return_value = mock_ctx
-
-            result = impl.validate(df, expectations)
-
-            # Verify no expectations were added
-            mock_suite.add_expectation_configuration.assert_not_called()
-            assert result["success"] is True
-
-    def test_validate_handles_expectation_without_kwargs(self, mock_validator_result, mock_execution_engine):
-        """Test that validate handles expectations without 'kwargs' key."""
-        impl = ConcreteGreatExpectationsValidation(mock_execution_engine)
-        df = Mock()
-        expectations = {
-            "expectation_suite_name": "test_suite",
-            "expectations": [
-                {
-                    "expectation_type": "expect_table_row_count_to_be_between"
-                    # No 'kwargs' key
-                }
-            ],
-        }
 
-        with patch("tgedr_dataops_abs.great_expectations_validation.Batch"), \
-             patch("tgedr_dataops_abs.great_expectations_validation.gx.get_context") as mock_context, \
-             patch("tgedr_dataops_abs.great_expectations_validation.gx.ExpectationSuite") as mock_suite_class, \
-             patch("tgedr_dataops_abs.great_expectations_validation.ExpectationConfiguration") as mock_exp_config_class, \
-             patch("tgedr_dataops_abs.great_expectations_validation.Validator") as mock_validator_class:
+class TestValidateManyMethod:
+    """Tests for the validate_many method."""
 
-            mock_suite = Mock()
-            mock_suite_class.return_value = mock_suite
+    @pytest.fixture(autouse=True)
+    def worker_instances(self):
+        """Forget worker instances kept from other tests."""
+        _get_worker_validation.cache_clear()
+        yield
+        _get_worker_validation.cache_clear()
 
-            mock_exp_config = Mock()
-            mock_exp_config_class.return_value = mock_exp_config
+    def test_validate_many_in_worker_processes(self):
+        """Test that validate_many validates every dataframe in real worker processes, keeping the order."""
+        result = EchoValidation().validate_many([1, 2, 3], _NO_EXPECTATIONS, max_workers=2)
 
-            mock_validator = Mock(spec=Validator)
-            mock_validator.validate.return_value = mock_validator_result
-            mock_validator_class.return_value = mock_validator
+        assert result == [{"success": True, "df": df} for df in (1, 2, 3)]
 
-            mock_ctx = Mock()
-            mock_context.return_value = mock_ctx
+    def test_validate_many_returns_results_in_order(self):
+        """Test that validate_many, run here on threads, keeps the order and validates with separate worker instances."""
+        impl = ConcreteGreatExpectationsValidation()
+        dfs = [Mock(), Mock(), Mock()]
+        expectations = _NO_EXPECTATIONS
 
-            impl.validate(df, expectations)
+        def validate(self, df, expectations):
+            return {"success": True, "df": df}
 
-            # Verify expectation was created with empty kwargs
-            mock_exp_config_class.assert_called_once()
-            call_kwargs = mock_exp_config_class.call_args[1]
-            assert call_kwargs["kwargs"] == {}
+        with patch(
+            "tgedr_dataops_abs.great_expectations_validation.ProcessPoolExecutor", ThreadPoolExecutor
+        ), patch.object(ConcreteGreatExpectationsValidation, "validate", autospec=True, side_effect=validate) as mock_validate:
+            result = impl.validate_many(dfs, expectations, max_workers=2)
 
-    def test_validate_creates_ephemeral_context(self, mock_validator_result, mock_execution_engine):
-        """Test that validate creates an ephemeral context."""
-        impl = ConcreteGreatExpectationsValidation(mock_execution_engine)
-        df = Mock()
-        expectations = {"expectations": []}
+        assert [r["df"] for r in result] == dfs
+        assert mock_validate.call_count == 3
+        for validate_call in mock_validate.call_args_list:
+            assert validate_call[0][0] is not impl
+            assert validate_call[0][2] == expectations
 
-        with patch("tgedr_dataops_abs.great_expectations_validation.Batch"), \
-             patch("tgedr_dataops_abs.great_expectations_validation.gx.get_context") as mock_get_context, \
-             patch("tgedr_dataops_abs.great_expectations_validation.gx.ExpectationSuite"), \
-             patch("tgedr_dataops_abs.great_expectations_validation.Validator") as mock_validator_class:
+    def test_validate_many_reuses_worker_instance(self):
+        """Test that each worker validates with one instance of the implementation."""
+        impl = ConcreteGreatExpectationsValidation()
 
-            mock_ctx = Mock()
-            mock_get_context.return_value = mock_ctx
+        with patch(
+            "tgedr_dataops_abs.great_expectations_validation.ProcessPoolExecutor", ThreadPoolExecutor
+        ), patch.object(ConcreteGreatExpectationsValidation, "validate", autospec=True, return_value={"success": True}) as mock_validate:
+            impl.validate_many([Mock(), Mock()], _NO_EXPECTATIONS, max_workers=1)
 
-            mock_validator = Mock(spec=Validator)
-            mock_validator.validate.return_value = mock_validator_result
-            mock_validator_class.return_value = mock_validator
+        assert mock_validate.call_args_list[0][0][0] is mock_validate.call_args_list[1][0][0]
 
-            impl.validate(df, expectations)
+    def test_validate_many_raises_validation_error(self):
+        """Test that validate_many raises the ValidationError of a failed dataframe."""
+        impl = ConcreteGreatExpectationsValidation()
 
-            # Verify get_context was called with mode="ephemeral"
-            mock_get_context.assert_called_once_with(mode="ephemeral")
+        with patch(
+            "tgedr_dataops_abs.great_expectations_validation.ProcessPoolExecutor", ThreadPoolExecutor
+        ), patch.object(ConcreteGreatExpectationsValidation, "validate", side_effect=ValidationError("Test error")):
+            with pytest.raises(ValidationError, match="Test error"):
+                impl.validate_many([Mock()], _NO_EXPECTATIONS)
 
 
 class TestGetExecutionEngine:
@@ -558,15 +533,13 @@ class TestGetExecutionEngine:
         with pytest.raises(TypeError, match="Can't instantiate abstract class"):
             IncompleteImplementation()
 
-    def test_concrete_implementation_get_execution_engine_is_called(self):
+    def test_concrete_implementation_get_execution_engine_is_called(self, patched_gx, mock_validator, mock_execution_engine):
         """Test that the concrete _get_execution_engine is actually called."""
-        mock_engine = Mock(spec=ExecutionEngine)
-        mock_engine.batch_manager = Mock()
 
         class TestImplementation(GreatExpectationsValidation):
             def __init__(self):
                 self.get_engine_called = False
-                self.mock_engine = mock_engine
+                self.mock_engine = mock_execution_engine
 
             def _get_execution_engine(self, batch_data_dict: dict) -> ExecutionEngine:
                 self.get_engine_called = True
@@ -574,24 +547,50 @@ class TestGetExecutionEngine:
 
         impl = TestImplementation()
         df = Mock()
-        expectations = {"expectations": []}
+        expectations = _NO_EXPECTATIONS
 
         mock_result = Mock()
         mock_result.to_json_dict.return_value = {"success": True}
+        mock_validator.validate.return_value = mock_result
 
-        with patch("tgedr_dataops_abs.great_expectations_validation.Batch"), \
-             patch("tgedr_dataops_abs.great_expectations_validation.gx.get_context") as mock_context, \
-             patch("tgedr_dataops_abs.great_expectations_validation.gx.ExpectationSuite"), \
-             patch("tgedr_dataops_abs.great_expectations_validation.Validator") as mock_validator_class:
+        impl.validate(df, expectations)
 
-            mock_validator = Mock(spec=Validator)
-            mock_validator.validate.return_value = mock_result
-            mock_validator_class.return_value = mock_validator
+        # Verify _get_execution_engine was called
+        assert impl.get_engine_called is True
 
-            mock_ctx = Mock()
-            mock_context.return_value = mock_ctx
 
-            impl.validate(df, expectations)
+class PandasValidation(GreatExpectationsValidation):
+    """Implementation validating pandas dataframes with a real execution engine."""
+
+    def _get_execution_engine(self, batch_data_dict: dict) -> ExecutionEngine:
+        """Return a pandas execution engine for the batch data."""
+        from great_expectations.execution_engine import PandasExecutionEngine
+
+        return PandasExecutionEngine(batch_data_dict=batch_data_dict)
+
+
+def _expect_between(min_value, max_value):
+    return {
+        "expectation_type": "expect_column_values_to_be_between",
+        "kwargs": {"column": "value", "min_value": min_value, "max_value": max_value},
+    }
+
+
+class TestValidateDuplicateDomain:
+    """Tests for expectations sharing a domain, validated with a real execution engine."""
+
+    @pytest.mark.parametrize(
+        ("expectations", "success"),
+        [
+            pytest.param([_expect_between(0, 5), _expect_between(10, 50)], True, id="failing_first"),
+            pytest.param([_expect_between(10, 50), _expect_between(0, 5)], False, id="failing_last"),
+        ],
+    )
+    def test_validate_evaluates_last_expectation_of_a_domain(self, expectations, success):
+        """Test that only the last of the expectations on the same domain is evaluated."""
+        import pandas as pd
+
+        result = PandasValidation().validate(pd.DataFrame({"value": [20, 30]}), {"expectations": expectations})
 
-            # Verify _get_execution_engine was called
-            assert impl.get_engine_called is True
+        assert result["success"] is success
+        assert result["statistics"]["evaluated_expectations"] == 1
@@ -0,0 +1,71 @@
+import sys
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+from tgedr_dataops_abs.processor import Processor, ProcessorException
+
+
+def scale(values, factor):
+    return values * factor
+
+
+def test_jit_compiles_with_numba(monkeypatch):
+    """Test Processor.jit compiles the kernel with numba, without the GIL and cached."""
+    compiled = Mock()
+    njit = Mock(return_value=Mock(return_value=compiled))
+    monkeypatch.setitem(sys.modules, "numba", SimpleNamespace(njit=njit))
+
+    assert Processor.jit(scale) is compiled
+    njit.assert_called_once_with(cache=True, nogil=True)
+    njit.return_value.assert_called_once_with(scale)
+
+
+def test_jit_requires_numba(monkeypatch):
+    """Test Processor.jit raises ProcessorException when numba is not installed."""
+    monkeypatch.setitem(sys.modules, "numba", None)
+
+    with pytest.raises(ProcessorException, match="numba is required"):
+        Processor.jit(scale)
+
+
+def test_jit_compiles_signatures_eagerly(monkeypatch):
+    """Test Processor.jit used with signatures hands them to numba for eager compilation."""
+    compiled = Mock()
+    njit = Mock(return_value=Mock(return_value=compiled))
+    monkeypatch.setitem(sys.modules, "numba", SimpleNamespace(njit=njit))
+
+    decorator = Processor.jit(signatures=["float64[:](float64[:], float64)"])
+
+    assert decorator(scale) is compiled
+    njit.assert_called_once_with(["float64[:](float64[:], float64)"], cache=True, nogil=True)
+
+
+@pytest.mark.parametrize(
+    "signatures", [None, ["float64[:](float64[:], float64)"]], ids=["lazy", "eager"]
+)
+def test_jit_compiles_kernel(signatures):
+    """Test Processor.jit compiles a kernel that numba can run, with and without signatures."""
+    np = pytest.importorskip("numpy")
+    pytest.importorskip("numba")
+
+    compiled = Processor.jit(scale, signatures=signatures)
+
+    assert compiled(np.array([1.0, 2.5]), 2.0).tolist() == [2.0, 5.0]
+    assert len(compiled.signatures) == 1
+
+
+class SlottedProcessor(Processor):
+    __slots__ = ("_config",)
+
+    def process(self, context=None):
+        return self._config
+
+
+def test_slotted_processor_has_no_instance_dict():
+    """Test Processor subclasses declaring __slots__ don't carry an instance __dict__."""
+    processor = SlottedProcessor({"factor": 2})
+
+    assert not hasattr(processor, "__dict__")
+    assert processor.process() == {"factor": 2}
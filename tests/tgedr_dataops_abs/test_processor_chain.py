@@ -1,6 +1,10 @@
+from types import SimpleNamespace
 from typing import Any, Dict, Optional
 
-from tgedr_dataops_abs.chain import ProcessorChain
+import pytest
+
+from tgedr_dataops_abs.chain import Chain, ProcessorChain, ProcessorChainMixin
+from tgedr_dataops_abs.processor import ProcessorInterface
 
 
 class StartCount(ProcessorChain):
@@ -15,13 +19,127 @@ class AddOne(ProcessorChain):
 
 class ShowCount(ProcessorChain):
     def process(self, context: Optional[Dict[str, Any]] = None) -> None:
-        print(f"count: {context['state']}")
+        context.setdefault("_log", []).append(context["state"])
+
+
+# the same handlers built on the mixin, which is not a processor itself so they are registered as such
+@ProcessorInterface.register
+class MixinStartCount(ProcessorChainMixin):
+    def process(self, context: Optional[Dict[str, Any]] = None) -> Any:
+        context["state"] = 2
+
+
+@ProcessorInterface.register
+class MixinAddOne(ProcessorChainMixin):
+    def process(self, context: Optional[Dict[str, Any]] = None) -> None:
+        context["state"] = context["state"] + 1
+
+
+@ProcessorInterface.register
+class MixinShowCount(ProcessorChainMixin):
+    def process(self, context: Optional[Dict[str, Any]] = None) -> None:
+        context.setdefault("_log", []).append(context["state"])
+
+
+HANDLERS = {
+    "chain": SimpleNamespace(StartCount=StartCount, AddOne=AddOne, ShowCount=ShowCount),
+    "mixin": SimpleNamespace(StartCount=MixinStartCount, AddOne=MixinAddOne, ShowCount=MixinShowCount),
+}
+
+
+@pytest.fixture(params=list(HANDLERS))
+def handlers(request):
+    return HANDLERS[request.param]
 
 
-def test_handling():
-    chain = StartCount().next(AddOne()).next(ShowCount())
+def test_handling(handlers):
+    chain = handlers.StartCount().next(handlers.ShowCount()).next(handlers.AddOne()).next(handlers.ShowCount())
 
     context = {}
     chain.execute(context)
 
     assert 3 == (context["state"])
+    assert [2, 3] == context["_log"]
+
+
+class SlottedAddOne(ProcessorChain):
+    __slots__ = ("_config", "_next", "_tail")
+
+    def process(self, context: Optional[Dict[str, Any]] = None) -> None:
+        context["state"] = context["state"] + 1
+
+
+def test_slotted_handlers_can_be_chained():
+    chain = SlottedAddOne().next(SlottedAddOne()).next(SlottedAddOne())
+
+    context = {"state": 0}
+    chain.execute(context)
+
+    assert 3 == (context["state"])
+    assert not hasattr(chain, "__dict__")
+
+
+def test_handlers_are_processors(handlers):
+    assert isinstance(handlers.StartCount(), ProcessorInterface)
+
+
+def test_next_appends_after_nested_chain(handlers):
+    chain = handlers.StartCount().next(handlers.AddOne().next(handlers.AddOne())).next(handlers.AddOne())
+
+    context = {}
+    chain.execute(context)
+
+    assert 5 == (context["state"])
+
+
+def test_next_appends_many_handlers(handlers):
+    chain = handlers.StartCount()
+    for _ in range(100):
+        chain.next(handlers.AddOne())
+
+    context = {}
+    chain.execute(context)
+
+    assert 102 == (context["state"])
+
+
+def test_execute_long_chain_does_not_recurse(handlers):
+    chain = handlers.StartCount()
+    for _ in range(5000):
+        chain.next(handlers.AddOne())
+
+    context = {}
+    chain.execute(context)
+
+    assert 5002 == (context["state"])
+
+
+class MarkDone(Chain):
+    def execute(self, context: Optional[Dict[str, Any]] = None) -> Any:
+        context["done"] = context["state"]
+
+
+def test_execute_hands_over_to_other_chain_handlers(handlers):
+    chain = handlers.StartCount().next(handlers.AddOne()).next(MarkDone())
+
+    context = {}
+    chain.execute(context)
+
+    assert 3 == (context["done"])
+
+
+def test_run_chain_shares_one_context(handlers):
+    chain = handlers.StartCount().next(handlers.AddOne()).next(MarkDone())
+
+    context = chain.run_chain()
+
+    assert {"state": 3, "done": 3} == context
+
+
+def test_run_chain_with_initial_context(handlers):
+    initial = {"other": 1}
+
+    context = handlers.StartCount().next(handlers.AddOne()).run_chain(initial)
+
+    assert context is initial
+    assert {"other": 1, "state": 3} == context